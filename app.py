@@ -1,7 +1,17 @@
-from flask import Flask, render_template, request, redirect, url_for, session, flash
+from flask import Flask, render_template, stream_template, request, redirect, url_for, session, flash, get_flashed_messages, g, jsonify
 from flask_sqlalchemy import SQLAlchemy
-from datetime import date, timedelta
+from flask_caching import Cache
+from sqlalchemy import delete, event, func, inspect, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from collections import defaultdict
+from datetime import date
+from functools import lru_cache
+from jinja2 import FileSystemBytecodeCache
 from werkzeug.security import generate_password_hash, check_password_hash 
+import base64
+import click
+import numpy as np
 import os # ✅ नया: Environment variables (जैसे DATABASE_URL) पढ़ने के लिए
 
 # --- App Configuration ---
@@ -14,21 +24,54 @@ app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'YOUR_HIGHLY_SECRET_KEY_
 app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL') or 'sqlite:///habits.db'
 
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# SQLALCHEMY_ECHO=1 से हर SQL statement log होता है (N+1 queries पकड़ने के लिए)
+app.config['SQLALCHEMY_ECHO'] = os.environ.get('SQLALCHEMY_ECHO') == '1'
+
+# Postgres (production) के लिए connection pool; SQLite अपना default pool use करता है
+# insertmanyvalues_page_size: bulk inserts (bulk_add_completions) बड़े multi-row pages में जाते हैं
+if not app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        'pool_pre_ping': True, 'pool_size': 10, 'max_overflow': 20,
+        'insertmanyvalues_page_size': 10000,
+    }
 app.config['JSON_AS_ASCII'] = False 
 
+# Compiled templates disk पर cache होते हैं, ताकि नया worker उन्हें दोबारा parse न करे
+jinja_cache_dir = os.path.join(app.instance_path, 'jinja_cache')
+os.makedirs(jinja_cache_dir, exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory=jinja_cache_dir)
+
+# Password KDF और उसकी cost explicit रखें (Environment Variable से tune कर सकते हैं)
+app.config['PASSWORD_HASH_METHOD'] = os.environ.get('PASSWORD_HASH_METHOD', 'scrypt:32768:8:1')
+
 db = SQLAlchemy(app)
 
+# SQLite: WAL mode ताकि readers और writer एक-दूसरे को block न करें
+with app.app_context():
+    if db.engine.dialect.name == 'sqlite':
+        @event.listens_for(db.engine, 'connect')
+        def set_sqlite_pragma(dbapi_conn, _):
+            cursor = dbapi_conn.cursor()
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+            cursor.close()
+
+# Dashboard data per-process memory में cache होता है (key में data version शामिल है)
+cache = Cache(app, config={'CACHE_TYPE': os.environ.get('CACHE_TYPE', 'SimpleCache')})
 
-# --- Database Models (No Change) ---
+
+# --- Database Models ---
 
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
-    password_hash = db.Column(db.String(128), nullable=False)
-    habits = db.relationship('Habit', backref='user', lazy=True, cascade="all, delete-orphan")
+    password_hash = db.Column(db.String(255), nullable=False) # scrypt hash ~162 chars का होता है
+    # Habits/completions में हर write पर बढ़ता है; dashboard cache की key का हिस्सा
+    data_version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    habits = db.relationship('Habit', backref='user', lazy='select', cascade="all, delete-orphan")
 
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = generate_password_hash(password, method=app.config['PASSWORD_HASH_METHOD'])
 
     def check_password(self, password):
         # Werkzeug 3.x के लिए यह सही है
@@ -39,23 +82,145 @@ class Habit(db.Model):
     name = db.Column(db.String(100), nullable=False)
     goal_duration = db.Column(db.Integer, default=365) 
     start_date = db.Column(db.Date, default=date.today) 
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False) 
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True) 
     
-    completions = db.relationship('Completion', backref='habit', lazy=True, cascade="all, delete-orphan")
+    completions = db.relationship('Completion', backref='habit', lazy='select', cascade="all, delete-orphan")
 
 class Completion(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    date = db.Column(db.Date, nullable=False, default=date.today)
+    # Date को integer ordinal (date.toordinal()) के रूप में store करते हैं: छोटी rows, तेज़ comparisons
+    date_ord = db.Column(db.Integer, nullable=False, default=lambda: date.today().toordinal())
     habit_id = db.Column(db.Integer, db.ForeignKey('habit.id'), nullable=False)
 
-# --- Helper Function for Dates (No Change) ---
-def get_seven_days():
-    """Returns a list of the last 7 days starting from today."""
-    today = date.today()
-    days = [today - timedelta(days=i) for i in range(7)]
-    return days[::-1]
+    # (habit_id, date_ord) lookup हर toggle पर होता है; unique constraint उसका index भी है
+    __table_args__ = (
+        db.UniqueConstraint('habit_id', 'date_ord', name='uq_habit_date'),
+    )
+
+    @property
+    def date(self):
+        return date.fromordinal(self.date_ord)
+
+# --- Helper Function for Dates ---
+@lru_cache(maxsize=1) # list सिर्फ दिन बदलने पर बदलती है
+def get_seven_days(today):
+    """Returns a tuple of the last 7 days ending with `today`."""
+    base = today.toordinal()
+    return tuple(date.fromordinal(base - i) for i in range(6, -1, -1))
+
+# --- Dashboard Data (Cached) ---
+# Heatmap cell (css class, title), indexed by status code; index.html का JS इसे use करता है
+HEATMAP_CELL_STYLES = (
+    ('pending', 'Pending'),
+    ('missed', 'Missed/Freez'), # 'Freez' के लिए लाल/ग्रे
+    ('completed', 'Completed'),
+)
+
+def pie_and_progress(completed, days_since, goals):
+    """Vectorized goal progress and lifetime completed/missed percentages.
+
+    All arguments are equal-length int arrays (one entry per habit). Percentages
+    are returned unrounded; habits that have not started yet (or have no positive
+    goal) get 0.
+    """
+    has_goal = goals > 0
+    progress = np.where(has_goal, np.minimum(100, (completed / np.where(has_goal, goals, 1) * 100).astype(np.int64)), 0)
+    started = days_since > 0
+    days = np.where(started, days_since, 1)
+    missed = np.maximum(0, days_since - completed)
+    completed_pct = np.where(started, completed / days * 100, 0.0)
+    missed_pct = np.where(started, missed / days * 100, 0.0)
+    return progress, completed_pct, missed_pct
+
+@cache.memoize()
+def build_habit_data(user_id, today, version):
+    """Builds the per-habit dashboard data (progress, pie chart, heatmap).
+
+    `version` (the user's `data_version`) is only part of the cache key: together
+    with `today` it makes any write to the user's habits/completions (or a new day)
+    produce a fresh entry.
+    """
+    today_ord = today.toordinal()
+    habits = Habit.query.filter_by(user_id=user_id).all()
+
+    habit_ids = [habit.id for habit in habits]
+
+    # Lifetime count SQL में aggregate होता है; dates सिर्फ heatmap window (365 दिन) की चाहिए
+    completed_counts = dict(
+        db.session.query(Completion.habit_id, func.count())
+        .filter(Completion.habit_id.in_(habit_ids))
+        .group_by(Completion.habit_id)
+        .all()
+    )
+    completions_by_habit = defaultdict(set)
+    rows = db.session.query(Completion.habit_id, Completion.date_ord).filter(
+        Completion.habit_id.in_(habit_ids),
+        Completion.date_ord >= today_ord - 364,
+    ).all()
+    for habit_id, date_ord in rows:
+        completions_by_habit[habit_id].add(date_ord)
+    seven_days = get_seven_days(today)
+    
+    # Progress और pie chart का math सभी habits के लिए एक साथ (arrays पर)
+    completed = np.array([completed_counts.get(habit.id, 0) for habit in habits], dtype=np.int64)
+    goals = np.array([habit.goal_duration for habit in habits], dtype=np.int64)
+    days_since = np.array([today_ord - habit.start_date.toordinal() + 1 for habit in habits], dtype=np.int64)
+    progress, completed_pct, missed_pct = pie_and_progress(completed, days_since, goals)
+
+    habit_data = []
+    for i, habit in enumerate(habits):
+        completed_ords = completions_by_habit[habit.id]
+        
+        # --- Goal Progress Calculation ---
+        goal_status_text = f"{int(completed[i])} / {habit.goal_duration} Days"
+        progress_percent = int(progress[i])
+        daily_status = [day.toordinal() in completed_ords for day in seven_days]
+        
+        # --- PIE CHART DATA (Lifetime Performance) ---
+        pie_chart_data = [round(float(completed_pct[i]), 1), round(float(missed_pct[i]), 1)]
+        pie_chart_labels = ['Completed', 'Missed/Freez']
+
+        
+        # --- HEATMAP DATA CALCULATION (LAST 365 DAYS) ---
+        start_ord = max(today_ord - 364, habit.start_date.toordinal())
+
+        # पूरे view के लिए status एक साथ (vectorized) निकालें
+        day_ords = np.arange(start_ord, today_ord + 1)
+        comp_ords = np.fromiter(completed_ords, dtype=np.int64, count=len(completed_ords))
+        statuses = np.isin(day_ords, comp_ords).astype(np.uint8)
+
+        # 365 दिनों का status bit-packed (LSB first) भेजें; cells browser में बनते हैं
+        heatmap_bits = base64.b64encode(np.packbits(statuses, bitorder='little').tobytes()).decode()
+            
+        habit_data.append({
+            'name': habit.name,
+            'id': habit.id,
+            'daily_status': daily_status,
+            'heatmap_bits': heatmap_bits,
+            'heatmap_start': date.fromordinal(start_ord).isoformat(),
+            'heatmap_days': len(day_ords),
+            'start_date': habit.start_date, 
+            'goal_status': goal_status_text,
+            'progress_percent': progress_percent,
+            'pie_chart_data': pie_chart_data,
+            'pie_chart_labels': pie_chart_labels,
+        })
+
+    return habit_data
+
+def bump_data_version(user):
+    """Invalidates the user's cached dashboard data; call inside the write's transaction."""
+    cache.delete_memoized(build_habit_data, user.id, date.today(), user.data_version)
+    db.session.execute(update(User).where(User.id == user.id).values(data_version=User.data_version + 1))
 
-# --- Authentication Routes (No Change) ---
+# --- Per-Request User ---
+@app.before_request
+def load_user():
+    """Loads the logged-in user once per request into `g.user` (None if logged out)."""
+    user_id = session.get('user_id')
+    g.user = db.session.get(User, user_id) if user_id is not None else None
+
+# --- Authentication Routes ---
 @app.route('/signup', methods=['GET', 'POST'])
 def signup():
     if request.method == 'POST':
@@ -111,11 +276,12 @@ def logout():
 
 @app.route('/', methods=['GET', 'POST'])
 def index():
-    if 'user_id' not in session:
+    if g.user is None:
         flash('Please log in to view your habits.', 'warning')
         return redirect(url_for('login'))
         
-    user_id = session['user_id']
+    user_id = g.user.id
+    today = date.today()
 
     if request.method == 'POST':
         habit_name = request.form.get('habit_name')
@@ -125,104 +291,37 @@ def index():
             goal_duration = int(goal_duration_str)
         except ValueError:
             goal_duration = 365 
+        goal_duration = max(1, goal_duration) # 0/negative goal से progress % बेमानी हो जाता है
             
         if habit_name:
-            new_habit = Habit(name=habit_name, goal_duration=goal_duration, start_date=date.today(), user_id=user_id)
+            new_habit = Habit(name=habit_name, goal_duration=goal_duration, start_date=today, user_id=user_id)
             db.session.add(new_habit)
+            bump_data_version(g.user)
             db.session.commit()
             return redirect(url_for('index'))
     
-    habits = Habit.query.filter_by(user_id=user_id).all()
-    seven_days = get_seven_days()
-    
-    habit_data = []
-    for habit in habits:
-        completed_dates = {comp.date for comp in habit.completions}
-        
-        # --- Goal Progress Calculation ---
-        completed_count = Completion.query.filter_by(habit_id=habit.id).count()
-        goal_status_text = f"{completed_count} / {habit.goal_duration} Days"
-        progress_percent = min(100, int((completed_count / habit.goal_duration) * 100))
-        daily_status = [day in completed_dates for day in seven_days]
-        
-        # --- PIE CHART DATA (Lifetime Performance) ---
-        today = date.today()
-        days_since_start = (today - habit.start_date).days + 1
-        
-        missed_days = days_since_start - completed_count
-        missed_days = max(0, missed_days)
-        
-        if days_since_start > 0:
-            completed_percent = round((completed_count / days_since_start) * 100, 1)
-            missed_percent = round((missed_days / days_since_start) * 100, 1)
-        else:
-            completed_percent = 0
-            missed_percent = 0
-
-        pie_chart_data = [completed_percent, missed_percent]
-        pie_chart_labels = ['Completed', 'Missed/Freez']
-
-        
-        # --- HEATMAP DATA CALCULATION (LAST 365 DAYS) ---
-        start_date_of_view = today - timedelta(days=364)
-        
-        if start_date_of_view < habit.start_date:
-            start_date_of_view = habit.start_date
-
-        heatmap_data = []
-        current_day = start_date_of_view
-        
-        while current_day <= today:
-            status = 1 if current_day in completed_dates else 0
-            
-            if (today - current_day).days >= 365: 
-                break 
-
-            if status == 1:
-                css_class = 'completed'
-                title_text = 'Completed'
-            elif current_day < today:
-                css_class = 'missed' # 'Freez' के लिए लाल/ग्रे
-                title_text = 'Missed/Freez'
-            else:
-                css_class = 'pending'
-                title_text = 'Pending'
-                
-            heatmap_data.append({
-                'date': current_day,
-                'status': status,
-                'class': css_class,
-                'title': title_text
-            })
-            current_day += timedelta(days=1)
-            
-        habit_data.append({
-            'name': habit.name,
-            'id': habit.id,
-            'daily_status': daily_status,
-            'heatmap_data': heatmap_data, 
-            'start_date': habit.start_date, 
-            'goal_status': goal_status_text,
-            'progress_percent': progress_percent,
-            'pie_chart_data': pie_chart_data,
-            'pie_chart_labels': pie_chart_labels,
-        })
+    habit_data = build_habit_data(user_id, today, g.user.data_version)
+    seven_days = get_seven_days(today)
 
-    return render_template('index.html', habit_data=habit_data, seven_days=seven_days, username=session.get('username'))
+    # Streaming में session template render होने से पहले save हो जाता है; इसलिए flashes
+    # अभी pop करें (request context पर cache हो जाते हैं, base.html वहीं से पढ़ता है)
+    get_flashed_messages(with_categories=True)
+    return stream_template('index.html', habit_data=habit_data, seven_days=seven_days, heatmap_styles=HEATMAP_CELL_STYLES, username=g.user.username)
 
-# --- Delete and Complete Routes (No Change) ---
+# --- Delete and Complete Routes ---
 
 @app.route('/delete_habit/<int:habit_id>', methods=['POST'])
 def delete_habit(habit_id):
-    if 'user_id' not in session:
+    if g.user is None:
         flash('Please log in.', 'warning')
         return redirect(url_for('login'))
 
-    user_id = session['user_id']
+    user_id = g.user.id
     habit_to_delete = Habit.query.filter_by(id=habit_id, user_id=user_id).first()
 
     if habit_to_delete:
         db.session.delete(habit_to_delete)
+        bump_data_version(g.user)
         db.session.commit()
         flash(f'Habit "{habit_to_delete.name}" has been deleted.', 'success')
     else:
@@ -230,13 +329,33 @@ def delete_habit(habit_id):
 
     return redirect(url_for('index'))
 
+def toggle_completion(user, habit_id, completion_date):
+    """Toggles a habit's completion for `completion_date` and returns the new status (1/0)."""
+    # पहले insert करें; अगर row पहले से है (conflict) तो उसे delete करें
+    insert = pg_insert if db.session.get_bind().dialect.name == 'postgresql' else sqlite_insert
+    result = db.session.execute(
+        insert(Completion)
+        .values(habit_id=habit_id, date_ord=completion_date.toordinal())
+        .on_conflict_do_nothing(index_elements=['habit_id', 'date_ord'])
+    )
+    new_status = 1
+    if result.rowcount == 0:
+        db.session.execute(
+            delete(Completion).where(Completion.habit_id == habit_id, Completion.date_ord == completion_date.toordinal())
+        )
+        new_status = 0
+        
+    bump_data_version(user)
+    db.session.commit()
+    return new_status
+
 @app.route('/complete/<int:habit_id>/<string:date_str>')
 def complete_habit(habit_id, date_str):
-    if 'user_id' not in session:
+    if g.user is None:
         flash('Please log in to track habits.', 'warning')
         return redirect(url_for('login'))
     
-    habit = Habit.query.filter_by(id=habit_id, user_id=session['user_id']).first()
+    habit = Habit.query.filter_by(id=habit_id, user_id=g.user.id).first()
     if not habit:
         flash('Habit not found or access denied.', 'danger')
         return redirect(url_for('index'))
@@ -246,18 +365,121 @@ def complete_habit(habit_id, date_str):
     except ValueError:
         return redirect(url_for('index'))
 
-    existing_completion = Completion.query.filter_by(
-        habit_id=habit_id, date=completion_date
-    ).first()
+    toggle_completion(g.user, habit_id, completion_date)
+    return redirect(url_for('index'))
+
+# Dashboard का JS इसे call करता है: पूरा page re-render किए बिना सिर्फ status लौटाता है
+@app.post('/api/complete/<int:habit_id>/<string:date_str>')
+def complete_api(habit_id, date_str):
+    if g.user is None:
+        return jsonify({'error': 'Please log in to track habits.'}), 401
+
+    habit = Habit.query.filter_by(id=habit_id, user_id=g.user.id).first()
+    if not habit:
+        return jsonify({'error': 'Habit not found or access denied.'}), 404
+
+    try:
+        completion_date = date.fromisoformat(date_str)
+    except ValueError:
+        return jsonify({'error': 'Invalid date.'}), 400
+
+    return jsonify({'status': toggle_completion(g.user, habit_id, completion_date)})
+
+
+# --- Sample Data Helpers (Seeding / Load Testing) ---
+
+def bulk_add_completions(habit, dates):
+    """Inserts completions for `habit` on all `dates` with one executemany."""
+    rows = [{'habit_id': habit.id, 'date_ord': day.toordinal()} for day in dates]
+    if rows:
+        db.session.execute(Completion.__table__.insert(), rows)
+        bump_data_version(habit.user)
+        db.session.commit()
+
+@app.cli.command('seed-completions')
+@click.argument('habit_id', type=int)
+@click.option('--days', default=365, help='Number of past days (including today) to mark completed.')
+def seed_completions(habit_id, days):
+    """Marks the last DAYS days of a habit as completed (sample data)."""
+    habit = db.session.get(Habit, habit_id)
+    if habit is None:
+        raise click.BadParameter(f'No habit with id {habit_id}.', param_hint='HABIT_ID')
+    today_ord = date.today().toordinal()
+    existing = {o for (o,) in db.session.query(Completion.date_ord).filter_by(habit_id=habit_id)}
+    dates = [date.fromordinal(today_ord - i) for i in range(days)]
+    bulk_add_completions(habit, [d for d in dates if d.toordinal() not in existing])
+    click.echo(f'Seeded completions for habit {habit_id}.')
+
+
+# --- Database Migration (Existing Installs) ---
+# db.create_all() सिर्फ नई tables बनाता है; पुरानी tables को current schema तक यह command लाता है
+
+@app.cli.command('migrate-db')
+def migrate_db():
+    """Brings an existing database up to the current schema (safe to run repeatedly)."""
+    db.create_all()
+    inspector = inspect(db.engine)
+    is_postgres = db.engine.dialect.name == 'postgresql'
+
+    completion_columns = {column['name'] for column in inspector.get_columns('completion')}
+    if 'date_ord' not in completion_columns:
+        # DATE -> integer ordinal; conversion Python में ताकि SQLite और Postgres दोनों पर एक जैसा चले
+        rows = [
+            {'id': row_id, 'habit_id': habit_id, 'date_ord': date.fromisoformat(str(value)[:10]).toordinal()}
+            for row_id, habit_id, value in db.session.execute(text('SELECT id, habit_id, "date" FROM completion ORDER BY id'))
+        ]
+        if is_postgres:
+            db.session.execute(text('ALTER TABLE completion ADD COLUMN date_ord INTEGER'))
+            if rows:
+                db.session.execute(
+                    text('UPDATE completion SET date_ord = :date_ord WHERE id = :id'),
+                    [{'id': row['id'], 'date_ord': row['date_ord']} for row in rows],
+                )
+            db.session.execute(text('ALTER TABLE completion ALTER COLUMN date_ord SET NOT NULL'))
+            db.session.execute(text('ALTER TABLE completion DROP COLUMN "date"'))
+        else:
+            # SQLite में ALTER COLUMN ... SET NOT NULL नहीं है: table rebuild करें ताकि schema
+            # create_all() वाला ही बने (NOT NULL date_ord + uq_habit_date); duplicates में lowest id रखें
+            db.session.execute(text('ALTER TABLE completion RENAME TO completion_old'))
+            Completion.__table__.create(db.session.connection())
+            unique_rows = {}
+            for row in rows:
+                unique_rows.setdefault((row['habit_id'], row['date_ord']), row)
+            if unique_rows:
+                db.session.execute(Completion.__table__.insert(), list(unique_rows.values()))
+            db.session.execute(text('DROP TABLE completion_old'))
+        db.session.commit()
+        inspector = inspect(db.engine) # schema बदल गया; नीचे के checks fresh reflection से पढ़ें
+        click.echo('Converted completion.date to completion.date_ord.')
+
+    # toggle_completion() का ON CONFLICT इसी unique index पर निर्भर है; पहले duplicate rows हटाएं
+    completion_indexes = {index['name'] for index in inspector.get_indexes('completion')}
+    completion_indexes |= {constraint['name'] for constraint in inspector.get_unique_constraints('completion')}
+    if 'uq_habit_date' not in completion_indexes:
+        db.session.execute(text(
+            'DELETE FROM completion WHERE id NOT IN '
+            '(SELECT MIN(id) FROM completion GROUP BY habit_id, date_ord)'
+        ))
+        db.session.execute(text('CREATE UNIQUE INDEX uq_habit_date ON completion (habit_id, date_ord)'))
+        click.echo('Created unique index uq_habit_date.')
+
+    habit_indexes = {index['name'] for index in inspector.get_indexes('habit')}
+    if 'ix_habit_user_id' not in habit_indexes:
+        db.session.execute(text('CREATE INDEX ix_habit_user_id ON habit (user_id)'))
+        click.echo('Created index ix_habit_user_id.')
+
+    user_columns = {column['name']: column for column in inspector.get_columns('user')}
+    # SQLite VARCHAR length enforce नहीं करता; Postgres पर scrypt hash (~162 chars) के लिए column बड़ा करें
+    if is_postgres and (user_columns['password_hash']['type'].length or 0) < 255:
+        db.session.execute(text('ALTER TABLE "user" ALTER COLUMN password_hash TYPE VARCHAR(255)'))
+        click.echo('Widened user.password_hash to VARCHAR(255).')
+
+    if 'data_version' not in user_columns:
+        db.session.execute(text('ALTER TABLE "user" ADD COLUMN data_version INTEGER NOT NULL DEFAULT 0'))
+        click.echo('Added user.data_version.')
 
-    if existing_completion:
-        db.session.delete(existing_completion)
-    else:
-        new_completion = Completion(habit_id=habit_id, date=completion_date)
-        db.session.add(new_completion)
-        
     db.session.commit()
-    return redirect(url_for('index'))
+    click.echo('Database is up to date.')
 
 
 # --- Main Run Block ---
@@ -266,4 +488,5 @@ if __name__ == '__main__':
        
         db.create_all() 
         
-    app.run(debug=True)
\ No newline at end of file
+    # सिर्फ local development server; production में Procfile वाला gunicorn चलता है
+    app.run(debug=os.environ.get('FLASK_ENV') == 'development')
\ No newline at end of file